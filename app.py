@@ -5,12 +5,18 @@ import mimetypes
 import datetime
 import unicodedata
 import re
-from collections import Counter
+import csv
+import gzip
+import shutil
+import bisect
+import tempfile
+import threading
+from collections import Counter, OrderedDict
 from django.conf import settings
 from django.core.management import execute_from_command_line
 from django.core.wsgi import get_wsgi_application
 from django.urls import path
-from django.http import JsonResponse, HttpResponse, FileResponse
+from django.http import JsonResponse, HttpResponse, FileResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.deprecation import MiddlewareMixin
 
@@ -78,6 +84,7 @@ if not settings.configured:
 # 3. YARDIMCI FONKSİYONLAR
 # ==========================================
 DB = {}
+ANALYTICS = None  # load_data() hesaplar (Bkz. 7. ANALİTİK)
 
 
 def normalize_name(name):
@@ -107,24 +114,270 @@ def slugify_name(name):
     n = re.sub(r'[^a-z0-9]', '', n)
     return n
 
+# --- ERİŞİM KAYITLARI (AYLIK SEGMENTLİ LOG DEPOSU) ---
+# access_logs/2026-01.jsonl -> her satır bir kayıt, segment içinde saate göre sıralı
+# access_logs/archive/2025-09.jsonl.gz -> eski segmentler sıkıştırılmış halde
+LOG_DIR = os.path.join(BASE_DIR, 'access_logs')
+LOG_HOT_MONTHS = 3          # Son kaç ay hafızada tutulsun
+LOG_ARCHIVE_AFTER_MONTHS = 6  # Bundan eski segmentler gzip ile arşivlenir
+LOG_RETENTION_MONTHS = 24   # Bundan eski arşivler silinir (None = sonsuza kadar sakla)
+LOG_ADMIN_LIMIT = 500       # Yönetici panelinde varsayılan kayıt sayısı
+LOG_UNDATED_TIME = "0000-00-00 00:00:00"  # Sıralamada en eskiye düşer
+LOG_UNDATED_MONTH = LOG_UNDATED_TIME[:7]   # Saklama politikası bu segmente uygulanmaz
+LOG_TIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M"]
+LOG_DATE_FORMATS = ["%Y-%m-%d", "%d.%m.%Y"]  # Sorgularda sadece tarih verilebilir
+
+
+def normalize_log_time(value):
+    """Farklı tarih formatlarını sıralanabilir 'YYYY-MM-DD HH:MM:SS' formatına çevirir"""
+    raw = str(value or "").strip()
+    for fmt in LOG_TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(raw, fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    # Okunamayan tarih: ayrı 'tarihsiz' segmente düşsün (arşivlenmez/silinmez), kayıt kaybolmasın
+    return LOG_UNDATED_TIME
+
+
+def parse_log_bound(value, end=False):
+    """
+    Sorgu sınırını (start/end) kayıtlarla aynı formata çevirir.
+    Sadece tarih verilirse günün başı/sonu alınır. Okunamazsa ValueError.
+    """
+    raw = str(value).strip()
+    for fmt in LOG_TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(raw, fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    for fmt in LOG_DATE_FORMATS:
+        try:
+            day = datetime.datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
+            return day + (" 23:59:59" if end else " 00:00:00")
+        except ValueError:
+            pass
+    raise ValueError(f"Gecersiz tarih: {value}")
+
+
+def normalize_log_entry(log):
+    """Eski (timestamp/name) ve yeni (Saat/Kullanıcı) log şemalarını tek tipe çevirir"""
+    return {
+        "Saat": str(log.get("Saat") or log.get("timestamp") or "-"),
+        "Kullanıcı": str(log.get("Kullanıcı") or log.get("name") or log.get("username") or "Bilinmiyor"),
+        "Rol": str(log.get("Rol") or log.get("role") or "-"),
+        "İşlem": str(log.get("İşlem") or log.get("action") or "-")
+    }
+
+
+def month_shift(month_key, months):
+    """'2026-01' anahtarını verilen ay kadar geri/ileri kaydırır"""
+    y, m = int(month_key[:4]), int(month_key[5:7])
+    total = y * 12 + (m - 1) + months
+    return f"{total // 12:04d}-{total % 12 + 1:02d}"
+
+
+class LogSegment:
+    """Bir aylık kayıtlar: saate göre sıralı liste + kullanıcı bazlı indeks"""
+    def __init__(self, month):
+        self.month = month
+        self.times = []
+        self.entries = []
+        self.by_user = {}  # NORMALIZE İSİM -> (saatler, kayıtlar)
+
+    def add(self, entry):
+        t = entry["Saat"]
+        # Kayıtlar genelde sırayla gelir; gelmezse araya yerleştir
+        i = len(self.times) if not self.times or self.times[-1] <= t else bisect.bisect_right(self.times, t)
+        self.times.insert(i, t)
+        self.entries.insert(i, entry)
+
+        u_times, u_entries = self.by_user.setdefault(normalize_name(entry["Kullanıcı"]), ([], []))
+        j = len(u_times) if not u_times or u_times[-1] <= t else bisect.bisect_right(u_times, t)
+        u_times.insert(j, t)
+        u_entries.insert(j, entry)
+
+    def range(self, start=None, end=None, user=None):
+        """[start, end] aralığındaki kayıtlar (eskiden yeniye), ikili arama ile"""
+        times, entries = self.times, self.entries
+        if user is not None:
+            times, entries = self.by_user.get(normalize_name(user), ([], []))
+        lo = bisect.bisect_left(times, start) if start else 0
+        hi = bisect.bisect_right(times, end) if end else len(times)
+        return entries[lo:hi]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LogStore:
+    """
+    Erişim kayıtlarını aylık segmentlerde tutar.
+    Son LOG_HOT_MONTHS ay hafızadadır, daha eskileri sorgu anında diskten okunur.
+    """
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self.archive_dir = os.path.join(log_dir, 'archive')
+        self.hot = {}
+        self.counts = {}  # ay -> kayıt sayısı (arşivdekiler dahil)
+        self.lock = threading.Lock()
+
+    # --- Disk ---
+    def segment_path(self, month):
+        return os.path.join(self.log_dir, f"{month}.jsonl")
+
+    def archive_path(self, month):
+        return os.path.join(self.archive_dir, f"{month}.jsonl.gz")
+
+    def months_on_disk(self):
+        """Diskteki tüm segmentler: {ay: dosya yolu}"""
+        found = {}
+        if os.path.isdir(self.archive_dir):
+            for f in os.listdir(self.archive_dir):
+                if f.endswith('.jsonl.gz'): found[f[:-len('.jsonl.gz')]] = os.path.join(self.archive_dir, f)
+        if os.path.isdir(self.log_dir):
+            for f in os.listdir(self.log_dir):
+                if f.endswith('.jsonl'): found[f[:-len('.jsonl')]] = os.path.join(self.log_dir, f)
+        return found
+
+    def read_segment(self, month, path):
+        seg = LogSegment(month)
+        opener = gzip.open if path.endswith('.gz') else open
+        try:
+            with opener(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line: seg.add(json.loads(line))
+        except Exception as e:
+            print(f"HATA - {path}: {e}")
+        return seg
+
+    # --- Yükleme / Taşıma ---
+    def open(self, legacy_rows=None):
+        """Segmentleri yükler. Klasör yoksa eski access_logs.json listesini bir kez taşır."""
+        if not os.path.isdir(self.log_dir) and legacy_rows:
+            self.migrate(legacy_rows)
+        self.apply_retention()
+        current = datetime.datetime.now().strftime("%Y-%m")
+        oldest_hot = month_shift(current, -(LOG_HOT_MONTHS - 1))
+        for month, path in self.months_on_disk().items():
+            if month >= oldest_hot and not path.endswith('.gz'):
+                self.hot[month] = self.read_segment(month, path)
+                self.counts[month] = len(self.hot[month])
+            else:
+                # Hafızaya alınmayan segmentler sadece sayılır
+                self.counts[month] = self.count_segment(path)
+        return self
+
+    def count_segment(self, path):
+        opener = gzip.open if path.endswith('.gz') else open
+        try:
+            with opener(path, 'rt', encoding='utf-8') as f:
+                return sum(1 for line in f if line.strip())
+        except Exception as e:
+            print(f"HATA - {path}: {e}")
+            return 0
+
+    def migrate(self, legacy_rows):
+        by_month = {}
+        for log in legacy_rows:
+            entry = normalize_log_entry(log)
+            entry["Saat"] = normalize_log_time(entry["Saat"])
+            by_month.setdefault(entry["Saat"][:7], []).append(entry)
+        os.makedirs(self.log_dir, exist_ok=True)
+        for month, entries in by_month.items():
+            entries.sort(key=lambda x: x["Saat"])
+            with open(self.segment_path(month), 'a', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def apply_retention(self):
+        """Eski segmentleri gzip ile arşivler, saklama süresi dolanları siler"""
+        current = datetime.datetime.now().strftime("%Y-%m")
+        archive_before = month_shift(current, -LOG_ARCHIVE_AFTER_MONTHS)
+        delete_before = month_shift(current, -LOG_RETENTION_MONTHS) if LOG_RETENTION_MONTHS else None
+
+        for month, path in self.months_on_disk().items():
+            if month == LOG_UNDATED_MONTH: continue
+            try:
+                if delete_before and month < delete_before:
+                    os.remove(path)
+                    self.hot.pop(month, None)
+                    self.counts.pop(month, None)
+                elif month < archive_before and not path.endswith('.gz'):
+                    os.makedirs(self.archive_dir, exist_ok=True)
+                    with open(path, 'rb') as src, gzip.open(self.archive_path(month), 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    os.remove(path)
+                    self.hot.pop(month, None)
+            except Exception as e:
+                print(f"HATA - {path}: {e}")
+
+    # --- Yazma ---
+    def append(self, entry):
+        entry = normalize_log_entry(entry)
+        entry["Saat"] = normalize_log_time(entry["Saat"])
+        month = entry["Saat"][:7]
+        with self.lock:
+            is_new_month = month not in self.hot
+            self.hot.setdefault(month, LogSegment(month)).add(entry)
+            self.counts[month] = self.counts.get(month, 0) + 1
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                # Sadece yeni satır eklenir, tüm dosya yeniden yazılmaz
+                with open(self.segment_path(month), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except: pass
+            # Ay değiştiyse eski segmentleri hafızadan düşür ve arşivle
+            if is_new_month:
+                oldest_hot = month_shift(month, -(LOG_HOT_MONTHS - 1))
+                for old in [m for m in self.hot if m < oldest_hot]:
+                    del self.hot[old]
+                self.apply_retention()
+
+    # --- Okuma ---
+    def segments(self, start=None, end=None, newest_first=True):
+        """Aralıkla kesişen segmentler. Hafızada olmayanlar tek tek diskten okunur."""
+        on_disk = self.months_on_disk()
+        months = sorted(set(on_disk) | set(self.hot), reverse=newest_first)
+        for month in months:
+            if start and month < start[:7]: continue
+            if end and month > end[:7]: continue
+            seg = self.hot.get(month)
+            yield seg if seg is not None else self.read_segment(month, on_disk[month])
+
+    def query(self, start=None, end=None, user=None, limit=None, newest_first=True):
+        """Saat aralığı ve/veya kullanıcıya göre kayıtlar (varsayılan: en yeni en üstte)"""
+        result = []
+        for seg in self.segments(start, end, newest_first):
+            rows = seg.range(start, end, user)
+            result.extend(reversed(rows) if newest_first else rows)
+            if limit and len(result) >= limit:
+                return result[:limit]
+        return result
+
+    def __iter__(self):
+        """Tüm kayıtlar (en yeni en üstte), segment segment okunur"""
+        for seg in self.segments():
+            yield from reversed(seg.entries)
+
+    def hot_count(self):
+        """Sadece hafızadaki kayıt sayısı"""
+        return sum(len(seg) for seg in self.hot.values())
+
+    def __len__(self):
+        """Tüm kayıtlar (arşivdekiler dahil)"""
+        return sum(self.counts.values())
+
+
 def log_system_access(user, role, action):
-    """Sistem erişim kayıtlarını tutar ve dosyaya yazar"""
-    entry = {
+    """Sistem erişim kayıtlarını tutar ve aylık segment dosyasına ekler"""
+    DB['LOGS'].append({
         "Saat": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "Kullanıcı": user,
         "Rol": role,
         "İşlem": action
-    }
-    # En yeni kayıt en üstte olsun
-    DB['LOGS'].insert(0, entry)
-    
-    # Dosyaya kaydet
-    path = find_file('access_logs.json')
-    if not path: path = os.path.join(BASE_DIR, 'access_logs.json')
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(DB['LOGS'], f, indent=4, ensure_ascii=False)
-    except: pass
+    })
 
 def find_file(filename):
     """Klasördeki dosyayı büyük/küçük harf gözetmeksizin bulur"""
@@ -137,6 +390,160 @@ def find_file(filename):
     return None
 
 
+# --- BULANIK İSİM İNDEKSİ (TRIGRAM) ---
+# Tam eşleşme tutmadığında (ünvan farkı, yazım hatası, e-posta/dosya adı kısaltması)
+# isimleri en yakın adaya benzerlik puanıyla çözer. load_data() sonunda bir kez kurulur.
+PHOTO_DIR = 'akademisyen_fotograflari'
+FUZZY_MIN_SCORE = 0.6    # Bulanık eşleşme için en düşük benzerlik
+FUZZY_MIN_MARGIN = 0.15  # En iyi aday ikinciden en az bu kadar önde olmalı (yoksa belirsiz)
+NAME_TITLE_WORDS = {"PROF", "DR", "DOC", "ARS", "GOR", "OGR", "UYESI", "YRD", "GRV"}
+
+
+def fuzzy_key(text):
+    """'Prof.Dr. Ali DENİZ' -> 'ALI DENIZ' (ünvansız, aksansız, sadece harf/rakam)"""
+    n = normalize_name(text)
+    n = unicodedata.normalize('NFKD', n).encode('ascii', 'ignore').decode('ascii')
+    words = re.sub(r'[^A-Z0-9]+', ' ', n).split()
+    return " ".join(w for w in words if w not in NAME_TITLE_WORDS)
+
+
+def compact_key(text):
+    """Fotoğraf/e-posta adlarıyla tam karşılaştırma için: 'Ali DENİZ' -> 'alideniz'"""
+    return "".join(fuzzy_key(text).lower().split())
+
+
+def trigrams(key):
+    """pg_trgm tarzı: her kelime '  kelime ' şeklinde doldurulup 3'lü parçalara bölünür"""
+    grams = set()
+    for w in key.lower().split():
+        w = f"  {w} "
+        for i in range(len(w) - 2):
+            grams.add(w[i:i + 3])
+    return grams
+
+
+class NameIndex:
+    """Trigram -> aday listesi. Benzerlik = ortak trigram / toplam trigram (Jaccard)"""
+    def __init__(self):
+        self.entries = []   # (tür, anahtar, trigram sayısı, değer)
+        self.postings = {}  # trigram -> [entry id]
+        self.exact = {}     # (tür, anahtar) -> değer
+        self.photo_files = {}  # küçük harfli dosya adı -> diskteki gerçek ad
+
+    def add(self, kind, key, value):
+        if not key: return
+        self.exact.setdefault((kind, key), value)
+        grams = trigrams(key)
+        if not grams: return
+        entry_id = len(self.entries)
+        self.entries.append((kind, key, len(grams), value))
+        for g in grams:
+            self.postings.setdefault(g, []).append(entry_id)
+
+    def search(self, key, kinds, limit=5):
+        """[(puan, tür, anahtar, değer)] en benzerden başlayarak"""
+        grams = trigrams(key)
+        if not grams: return []
+        overlap = Counter()
+        for g in grams:
+            for entry_id in self.postings.get(g, ()):
+                if self.entries[entry_id][0] in kinds:
+                    overlap[entry_id] += 1
+        scored = []
+        for entry_id, common in overlap.items():
+            kind, e_key, e_len, value = self.entries[entry_id]
+            scored.append((common / (len(grams) + e_len - common), kind, e_key, value))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return scored[:limit]
+
+    def lookup(self, keys, kinds):
+        """Sadece tam eşleşme: ilk tutan anahtarın değeri (yoksa None)"""
+        for key in keys:
+            for kind in kinds:
+                if (kind, key) in self.exact: return self.exact[(kind, key)]
+        return None
+
+    def best(self, key, kinds, min_score=FUZZY_MIN_SCORE, margin=FUZZY_MIN_MARGIN):
+        """
+        Önce tam eşleşme, yoksa bulanık arama -> (değer, puan, adaylar).
+        En iyi aday eşiği geçmiyor ya da ikinciye yakınsa (belirsiz) değer None döner;
+        yanlış kişiyi göstermektense adaylar listelenir.
+        """
+        value = self.lookup([key], kinds)
+        if value is not None: return value, 1.0, []
+        candidates = []
+        for c in self.search(key, kinds):
+            # Aynı kayıt birden fazla anahtarla gelebilir, tekilleştir
+            if not any(c[3] is other[3] for other in candidates): candidates.append(c)
+        if not candidates: return None, 0.0, []
+        top = candidates[0][0]
+        second = candidates[1][0] if len(candidates) > 1 else 0.0
+        if top >= min_score and top - second >= margin:
+            return candidates[0][3], top, candidates
+        return None, top, candidates
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def build_name_index(db):
+    idx = NameIndex()
+    for email, acc in db['ACADEMICIANS'].items():
+        idx.add('academician', fuzzy_key(acc.get("Fullname")), acc)
+        idx.add('email', email.split('@')[0], acc)
+    for w in db['WEB_DATA']:
+        idx.add('web', fuzzy_key(w.get("Fullname")), w)
+        w_email = str(w.get("Email") or "").strip().lower()
+        if w_email:
+            idx.add('web_email', w_email, w)
+            idx.add('web_email', w_email.split('@')[0], w)
+
+    photo_path = os.path.join(BASE_DIR, PHOTO_DIR)
+    if os.path.isdir(photo_path):
+        for f in os.listdir(photo_path):
+            idx.photo_files[f.lower()] = f
+            stem = os.path.splitext(f)[0].lower()
+            idx.add('photo', re.sub(r'[^a-z0-9]', '', stem), f)
+    return idx
+
+
+def resolve_academician(name):
+    """İsimden akademisyen kaydı: önce tam, sonra kesin bulanık eşleşme -> (kayıt, puan, adaylar)"""
+    idx = DB['NAME_INDEX']
+    acc, score, candidates = idx.best(fuzzy_key(name), ('academician',))
+    if acc: return acc, score, candidates
+    # Tek kelimelik giriş kullanıcı adı / e-posta olabilir ('abaylar', 'abaylar@...')
+    username = str(name or "").strip().lower()
+    if username and " " not in username:
+        acc = idx.lookup([username.split('@')[0]], ('email',))
+        if acc: return acc, 1.0, []
+    return None, score, candidates
+
+
+def resolve_web_record(name, email=None):
+    """Web Data kaydı: e-posta en güvenilir anahtar, yoksa isim -> (kayıt, puan)"""
+    idx = DB['NAME_INDEX']
+    email = str(email or "").strip().lower()
+    if email:
+        w = idx.lookup([email], ('web_email',))
+        if w: return w, 1.0
+    w, score, _ = idx.best(fuzzy_key(name), ('web',))
+    return w, score
+
+
+def resolve_photo(name, email=None):
+    """
+    Fotoğraf dosya adı: Web Data'daki yol, yoksa dosya adının e-posta kullanıcı adı
+    ya da tam isimle birebir aynı olması gerekir (Başkasının fotoğrafı gösterilmez)
+    """
+    w, _ = resolve_web_record(name, email)
+    if w and w.get("Image_Path"):
+        return w["Image_Path"].replace('\\', '/').split('/')[-1]
+    keys = [compact_key(name)]
+    if email: keys.insert(0, str(email).split('@')[0].lower())
+    return DB['NAME_INDEX'].lookup(keys, ('photo',))
+
+
 # ==========================================
 # 4. VERİ YÜKLEME (DATA LOADING) - FİNAL SÜRÜM
 # ==========================================
@@ -153,8 +560,60 @@ def get_all_rows(data):
         return all_rows
     return []
 
+def clean_match_rows(rows, on_reject=None, validate=None):
+    """
+    n8n eşleşme satırlarını temizler (JSON ve Excel için ortak kurallar).
+    - Başlık satırları (Column1, sheet1, project_id...) atlanır.
+    - İsim hücresi boşsa bir önceki geçerli isim taşınır (birleştirilmiş hücreler).
+    - validate(satır) bir sebep döndürürse satır atlanır.
+    Atlanan satırlar için on_reject(sıra, satır, sebep) çağrılır.
+    """
+    last_valid_name = None 
+    for index, item in enumerate(rows):
+        raw_name = item.get('data') or item.get('academician_name') or item.get('Column1')
+        if raw_name:
+            temp_check = str(raw_name).strip()
+            if len(temp_check) > 2 and temp_check.lower() not in ["academician_name", "data", "sheet1", "column1", "matches"]:
+                last_valid_name = temp_check
+        current_name = raw_name if raw_name else last_valid_name
+        pid = str(item.get('Column3') or item.get('project_id') or "").strip()
+        if not current_name or not pid:
+            if on_reject: on_reject(index, item, "isim yok" if not current_name else "proje id yok")
+            continue
+        check_name = normalize_name(current_name)
+        if "COLUMN" in check_name or "SHEET" in check_name or "DATA" in check_name or pid.lower() in ["matches", "project_id", "column3", "column"]:
+            if on_reject: on_reject(index, item, "başlık satırı")
+            continue
+        item['data'] = current_name 
+        reason = validate(item) if validate else None
+        if reason:
+            if on_reject: on_reject(index, item, reason)
+            continue
+        yield item
+
+def match_project_id(m):
+    return str(m.get('Column3') or m.get('project_id') or "").strip()
+
+
+def get_project_title(pid, fallback=""):
+    """Proje ID'sinden başlığı bulur (Yoksa kısaltma, o da yoksa yedek değer)"""
+    pd = DB['PROJECTS'].get(str(pid).strip(), {})
+    return pd.get("title") or pd.get("acronym") or pd.get("project_acronym") or fallback or f"Proje-{pid}"
+
+
+def index_matches(matches):
+    """Eşleşmeleri isme ve projeye göre gruplar (Her istekte tüm listeyi taramamak için)"""
+    by_name, by_project = {}, {}
+    for m in matches:
+        norm = normalize_name(m.get('data'))
+        by_name.setdefault(norm, []).append(m)
+        pid = match_project_id(m)
+        if pid: by_project.setdefault(pid, set()).add(norm)
+    return by_name, by_project
+
+
 def load_data():
-    global DB
+    global DB, ANALYTICS
     temp_db = { 
         'PROJECTS': {}, 'ACADEMICIANS': {}, 'MATCHES': [], 
         'FEEDBACK': [], 'WEB_DATA': [], 'MESSAGES': [], 
@@ -177,24 +636,7 @@ def load_data():
                     data_list = get_all_rows(raw_json)
 
                     if key == 'matches':
-                        # ... (Buradaki kod aynı kalsın) ...
-                        clean_matches = []
-                        last_valid_name = None 
-                        for item in data_list:
-                            raw_name = item.get('data') or item.get('academician_name') or item.get('Column1')
-                            if raw_name:
-                                temp_check = str(raw_name).strip()
-                                if len(temp_check) > 2 and temp_check.lower() not in ["academician_name", "data", "sheet1", "column1", "matches"]:
-                                    last_valid_name = temp_check
-                            current_name = raw_name if raw_name else last_valid_name
-                            pid = str(item.get('Column3') or item.get('project_id') or "").strip()
-                            if not current_name or not pid: continue
-                            check_name = normalize_name(current_name)
-                            if "COLUMN" in check_name or "SHEET" in check_name or "DATA" in check_name: continue
-                            if pid.lower() in ["matches", "project_id", "column3", "column"]: continue
-                            item['data'] = current_name 
-                            clean_matches.append(item)
-                        temp_db['MATCHES'] = clean_matches
+                        temp_db['MATCHES'] = list(clean_match_rows(data_list))
 
                     elif key == 'projects':
                         for p in data_list:
@@ -213,6 +655,7 @@ def load_data():
                                 temp_db['PASSWORDS'][str(p_email).strip().lower()] = str(p_pass).strip()
 
                     # LİSTE OLMASINI GARANTİ EDELİM
+                    # (Sadece segment klasörü yoksa bir kez taşımak için okunur)
                     elif key == 'logs':
                         temp_db['LOGS'] = data_list if isinstance(data_list, list) else []
                     elif key == 'messages':
@@ -224,10 +667,19 @@ def load_data():
             except Exception as e:
                 print(f"HATA - {filename}: {e}")
     
+    temp_db['LOGS'] = LogStore(LOG_DIR).open(temp_db['LOGS'])
+    temp_db['NAME_INDEX'] = build_name_index(temp_db)
+    temp_db['MATCHES_BY_NAME'], temp_db['MATCHES_BY_PROJECT'] = index_matches(temp_db['MATCHES'])
     DB = temp_db
+    # Yeniden yüklemede eski profil cevapları sunulmasın
+    PROFILE_CACHE.clear()
 
-# Uygulama başlarken yükle
-load_data()
+    # İstatistikler (Hesaplanamazsa /api/analytics/ 503 döner)
+    try:
+        ANALYTICS = Analytics().build(DB)
+    except Exception as e:
+        print(f"HATA - analytics: {e}")
+        ANALYTICS = None
 
 # ==========================================
 # 5. RESİM BULUCU (IMAGE FINDER) - DÜZELTİLMİŞ (V4)
@@ -238,21 +690,15 @@ def get_image_url_for_name(name):
     DÜZELTME: Baştaki '/' işareti kaldırıldı.
     Böylece Frontend kendi slash'ini eklediğinde çift slash (//) hatası oluşmayacak.
     """
-    norm_name = normalize_name(name)
-    slug_name = slugify_name(name) 
-    
-    # 1. Yöntem: Web Data'dan
-    for w in DB['WEB_DATA']:
-        if normalize_name(w.get("Fullname")) == norm_name:
-            path_val = w.get("Image_Path")
-            if path_val:
-                filename = path_val.replace('\\', '/').split('/')[-1]
-                # Başına '/' koymadan dönüyoruz
-                return f"akademisyen_fotograflari/{filename}"
+    # 1. Yöntem: Web Data / fotoğraf klasörü (tam veya bulanık eşleşme)
+    filename = resolve_photo(name)
+    if filename:
+        # Başına '/' koymadan dönüyoruz
+        return f"{PHOTO_DIR}/{filename}"
     
     # 2. Yöntem: Tahmin
     # Başına '/' koymadan dönüyoruz
-    return f"akademisyen_fotograflari/{slug_name}.jpg"
+    return f"{PHOTO_DIR}/{slugify_name(name)}.jpg"
 
 
 # ==========================================
@@ -270,13 +716,19 @@ def api_test_data(request):
     status = {
         "DB_COUNTS": {k: len(v) for k, v in DB.items()},
         "SAMPLE_MATCH": DB['MATCHES'][0] if len(DB['MATCHES']) > 0 else "Veri Yok",
+        "PROFILE_CACHE": PROFILE_CACHE.stats(),
+        "LOGS_IN_MEMORY": DB['LOGS'].hot_count(),
     }
     if check_name:
         status['NAME_CHECK'] = {
             "Input": check_name,
             "Normalized": normalize_name(check_name),
             "Slugified": slugify_name(check_name),
-            "Predicted_URL": get_image_url_for_name(check_name)
+            "Predicted_URL": get_image_url_for_name(check_name),
+            "Candidates": [
+                {"score": round(score, 3), "type": kind, "key": key}
+                for score, kind, key, _ in DB['NAME_INDEX'].search(fuzzy_key(check_name), ('academician', 'web'))
+            ]
         }
     return JsonResponse(status, json_dumps_params={'indent': 4})
 
@@ -360,21 +812,23 @@ def api_logout(request):
         pass
     return JsonResponse({"status": "success", "message": "Cikis yapildi"})
         
-@csrf_exempt
-def api_admin_data(request):
-    """Yönetici Paneli: Puanlama hatası düzeltildi"""
-    if request.method == "OPTIONS": return JsonResponse({})
-    
-    acc_list = []
-    
-    # 1. Eşleşmeleri İsimlere Göre Grupla
-    matches_map = {} 
-    for m in DB.get('MATCHES', []):
-        raw_name = m.get('data')
-        if raw_name:
-            norm = normalize_name(raw_name)
-            if norm not in matches_map: matches_map[norm] = []
-            matches_map[norm].append(m)
+def parse_match_score(m):
+    """Eşleşme satırındaki puanı int'e çevirir (Column7 = Score)"""
+    raw_score = m.get('Column7') or m.get('score') or m.get('puan') or 0
+
+    # Eğer veri string ise temizle
+    if isinstance(raw_score, str):
+        raw_score = raw_score.replace('%', '').strip()
+
+    # Önce float'a, sonra int'e çevir (Örn: "95.0" -> 95.0 -> 95)
+    # Direkt int("95.0") hataya sebep olur, bu yöntem en güvenlisidir.
+    return int(float(raw_score))
+
+
+def iter_academician_summaries():
+    """Yönetici paneli için akademisyen özetlerini (proje sayısı, en iyi puan) üretir"""
+    # 1. Eşleşmeler açılışta isimlere göre gruplandı
+    matches_map = DB['MATCHES_BY_NAME']
 
     # 2. Akademisyenleri Döngüye Al
     for email, acc in DB['ACADEMICIANS'].items():
@@ -387,47 +841,39 @@ def api_admin_data(request):
         # --- PUAN HESAPLAMA (GÜÇLENDİRİLMİŞ) ---
         for m in my_matches:
             try:
-                # Olası sütun isimlerini dene (Column7 = Score)
-                raw_score = m.get('Column7') or m.get('score') or m.get('puan') or 0
-                
-                # Eğer veri string ise temizle
-                if isinstance(raw_score, str):
-                    raw_score = raw_score.replace('%', '').strip()
-                
-                # Önce float'a, sonra int'e çevir (Örn: "95.0" -> 95.0 -> 95)
-                # Direkt int("95.0") hataya sebep olur, bu yöntem en güvenlisidir.
-                s = int(float(raw_score))
-                
+                s = parse_match_score(m)
                 if s > best_score: best_score = s
             except:
                 # Hata olursa (örn: veri boşsa) bu projeyi atla
                 pass
             
-        image_path = get_image_url_for_name(name)
-        
-        acc_list.append({
+        yield {
             "name": name,
             "email": email,
             "project_count": len(my_matches),
             "best_score": best_score, # Artık doğru hesaplanmış puan gidecek
-            "image": image_path 
-        })
-    
-    # 3. Logları Hazırla (Eski/Yeni uyumlu)
-    raw_logs = DB.get('LOGS', [])
-    if not isinstance(raw_logs, list): raw_logs = []
+            "image": get_image_url_for_name(name)
+        }
+
+
+@csrf_exempt
+def api_admin_data(request):
+    """Yönetici Paneli: Puanlama hatası düzeltildi"""
+    if request.method == "OPTIONS": return JsonResponse({})
     
-    safe_logs = []
-    for log in raw_logs:
-        safe_logs.append({
-            "Saat": str(log.get("Saat") or log.get("timestamp") or "-"),
-            "Kullanıcı": str(log.get("Kullanıcı") or log.get("name") or log.get("username") or "Bilinmiyor"),
-            "Rol": str(log.get("Rol") or log.get("role") or "-"),
-            "İşlem": str(log.get("İşlem") or log.get("action") or "-")
-        })
+    acc_list = list(iter_academician_summaries())
     
-    # Tarihe göre sırala (En yeni en üstte)
-    safe_logs.sort(key=lambda x: x['Saat'], reverse=True)
+    # 3. Loglar (En yeni en üstte)
+    # ?start=2026-01-01&end=2026-01-31&user=Admin&limit=500 ile daraltılabilir
+    # Kayıtlarla aynı formata çevrilir (Sadece tarih verildiyse günün tamamı)
+    try:
+        start = parse_log_bound(request.GET['start']) if request.GET.get('start') else None
+        end = parse_log_bound(request.GET['end'], end=True) if request.GET.get('end') else None
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    limit = request.GET.get('limit', '')
+    limit = int(limit) if limit.isdigit() else LOG_ADMIN_LIMIT
+    safe_logs = DB['LOGS'].query(start=start, end=end, user=request.GET.get('user'), limit=limit)
 
     return JsonResponse({
         "academicians": acc_list,
@@ -437,112 +883,175 @@ def api_admin_data(request):
     })
 
 
+class ProfileCache:
+    """
+    Hazırlanmış profil cevapları (JSON) için boyut sınırlı LRU önbellek.
+    Anahtar: normalize edilmiş akademisyen adı. Karar kaydedilince sadece ilgili kişiler silinir.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        # Silme sayaçları: hazırlanırken silinen cevap önbelleğe geri yazılmasın
+        self.epoch = 0          # clear() ile artar
+        self.generations = {}   # anahtar -> invalidate() sayısı
+
+    def generation(self, key):
+        """Cevabı hazırlamaya başlamadan önce alınır, put() ile birlikte verilir"""
+        with self.lock:
+            return self.epoch, self.generations.get(key, 0)
+
+    def get(self, key):
+        with self.lock:
+            content = self.items.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def put(self, key, content, generation):
+        with self.lock:
+            # Arada karar yazıldıysa (ya da veri yeniden yüklendiyse) cevap eskidir, saklama
+            if generation != (self.epoch, self.generations.get(key, 0)):
+                return
+            self.items[key] = content
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys):
+        with self.lock:
+            for key in keys:
+                self.generations[key] = self.generations.get(key, 0) + 1
+                if self.items.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self.lock:
+            self.epoch += 1
+            self.items.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+PROFILE_CACHE_SIZE = 512
+PROFILE_CACHE = ProfileCache(PROFILE_CACHE_SIZE)
+
+
+def build_profile_payload(acc):
+    """Profil cevabını hazırlar (Karar ve ortaklar için FEEDBACK tek sefer taranır)"""
+    name = acc.get("Fullname")
+    norm_name = normalize_name(name)
+
+    # Web Data'dan Ek Bilgiler (Resim ve Telefon)
+    phone_number = "-" # Varsayılan
+    
+    # Akademisyenin E-postasını al (Eşleşme için en güvenli yol)
+    acc_email = acc.get("Email", "").strip().lower()
+
+    w, _ = resolve_web_record(name, acc_email)
+    if w:
+        # Telefon Numarası (Kullanıcı isteği: Direkt aynısı gelsin)
+        # Veritabanındaki "Work_Phone" neyse, harfi harfine o gelir.
+        val_phone = w.get("Work_Phone") or w.get("Phone") or w.get("Telefon")
+        if val_phone:
+            phone_number = str(val_phone)
+
+    # Resim: Web Data yolu, fotoğraf klasörü, en son isimden tahmin
+    photo = resolve_photo(name, acc_email)
+    img_url = f"{PHOTO_DIR}/{photo}" if photo else f"{PHOTO_DIR}/{slugify_name(name)}.jpg"
+
+    # Projeler: eşleşmeler isim indeksinden, kararlar tek geçişte
+    my_matches = DB['MATCHES_BY_NAME'].get(norm_name, [])
+    my_pids = {match_project_id(m) for m in my_matches}
+    my_decisions = {}
+    accepted_by = {}
+    for fb in DB.get('FEEDBACK', []):
+        pid = str(fb.get("projId"))
+        if pid not in my_pids: continue
+        fb_name = normalize_name(fb.get("academician"))
+        if fb_name == norm_name:
+            # İlk kayıt geçerli (Eski davranış)
+            my_decisions.setdefault(pid, fb.get("decision"))
+        elif fb.get("decision") == "accepted":
+            accepted_by.setdefault(pid, []).append(fb.get("academician"))
+
+    projects = []
+    for m in my_matches:
+        pid = match_project_id(m)
+        pd = DB['PROJECTS'].get(pid, {})
+        try:
+            score = parse_match_score(m)
+        except:
+            # Bozuk puan tüm profili düşürmesin
+            score = 0
+        projects.append({
+            "id": pid,
+            "title": pd.get("title") or pd.get("acronym") or f"Proje-{pid}",
+            "score": score,
+            "budget": pd.get("overall_budget", "-"),
+            "status": pd.get("status", "-"),
+            "objective": (pd.get("objective") or "")[:200] + "...",
+            "decision": my_decisions.get(pid, "waiting"),
+            "collaborators": accepted_by.get(pid, []),
+            "url": pd.get("url", "#")
+        })
+    
+    projects.sort(key=lambda x: x['score'], reverse=True)
+    
+    return {
+        "profile": {
+            "Fullname": acc.get("Fullname"),
+            "Email": acc.get("Email"),
+            "Title": acc.get("Title"),
+            "Field": acc.get("Field"),
+            "Image": img_url,
+            "Duties": acc.get("Duties", []),
+            "Phone": phone_number 
+        },
+        "projects": projects
+    }
+
+
 @csrf_exempt
 def api_profile(request):
-    """Akademisyen Profil: E-Posta ile Kesin Eşleşme ve Ham Telefon Verisi"""
+    """Akademisyen Profil: E-Posta ile Kesin Eşleşme ve Ham Telefon Verisi (Önbellekli)"""
     if request.method == "OPTIONS": return JsonResponse({})
     try:
         body = json.loads(request.body)
         name = body.get('name')
-        norm_name = normalize_name(name)
-        
-        # 1. Akademisyen Bilgisi (Veritabanından Bul)
-        acc = None
-        for email, p in DB['ACADEMICIANS'].items():
-            if normalize_name(p.get("Fullname")) == norm_name:
-                acc = p
-                break
-        if not acc: return JsonResponse({"error": "Bulunamadi"}, 404)
-
-        # 2. Web Data'dan Ek Bilgiler (Resim ve Telefon)
-        img_url = None
-        phone_number = "-" # Varsayılan
-        
-        # Akademisyenin E-postasını al (Eşleşme için en güvenli yol)
-        acc_email = acc.get("Email", "").strip().lower()
-
-        for w in DB.get('WEB_DATA', []):
-            # Web Data'daki E-posta ve İsim
-            w_email = str(w.get("Email", "")).strip().lower()
-            w_name = normalize_name(w.get("Fullname"))
-            
-            # EŞLEŞME KONTROLÜ:
-            # 1. E-posta tutuyor mu? (Kesin çözüm)
-            # 2. VEYA İsim tutuyor mu? (Yedek çözüm)
-            match_found = False
-            if acc_email and w_email and acc_email == w_email:
-                match_found = True
-            elif w_name == norm_name:
-                match_found = True
-                
-            if match_found:
-                # A. Resim Yolu
-                path_val = w.get("Image_Path")
-                if path_val:
-                    filename = path_val.replace('\\', '/').split('/')[-1]
-                    img_url = f"akademisyen_fotograflari/{filename}"
-                
-                # B. Telefon Numarası (Kullanıcı isteği: Direkt aynısı gelsin)
-                # Veritabanındaki "Work_Phone" neyse, harfi harfine o gelir.
-                val_phone = w.get("Work_Phone") or w.get("Phone") or w.get("Telefon")
-                if val_phone:
-                    phone_number = str(val_phone)
-                
-                # Eşleşme bulundu, döngüden çık
-                break
         
-        # Eğer resim bulunamadıysa isimden tahmin et
-        if not img_url:
-            slug_name = slugify_name(name)
-            img_url = f"akademisyen_fotograflari/{slug_name}.jpg"
-
-        # 3. Projeleri Bul (Değişmedi)
-        projects = []
-        for m in DB.get('MATCHES', []):
-            if normalize_name(m.get('data')) == norm_name:
-                pid = str(m.get('Column3') or m.get('project_id') or "")
-                pd = DB['PROJECTS'].get(pid, {})
-                
-                decision = "waiting"
-                # Feedback kontrolü
-                for fb in DB.get('FEEDBACK', []):
-                    if normalize_name(fb.get("academician")) == norm_name and str(fb.get("projId")) == pid:
-                        decision = fb.get("decision")
-                        break
-                
-                collaborators = []
-                for fb in DB.get('FEEDBACK', []):
-                    if str(fb.get("projId")) == pid and fb.get("decision") == "accepted":
-                         if normalize_name(fb.get("academician")) != norm_name:
-                            collaborators.append(fb.get("academician"))
-
-                projects.append({
-                    "id": pid,
-                    "title": pd.get("title") or pd.get("acronym") or f"Proje-{pid}",
-                    "score": int(float(m.get('Column7') or m.get('score') or 0)),
-                    "budget": pd.get("overall_budget", "-"),
-                    "status": pd.get("status", "-"),
-                    "objective": (pd.get("objective") or "")[:200] + "...",
-                    "decision": decision,
-                    "collaborators": collaborators,
-                    "url": pd.get("url", "#")
-                })
-        
-        projects.sort(key=lambda x: x['score'], reverse=True)
-        
-        return JsonResponse({
-            "profile": {
-                "Fullname": acc.get("Fullname"),
-                "Email": acc.get("Email"),
-                "Title": acc.get("Title"),
-                "Field": acc.get("Field"),
-                "Image": img_url,
-                "Duties": acc.get("Duties", []),
-                "Phone": phone_number 
-            },
-            "projects": projects
-        })
-    except Exception as e: return JsonResponse({"error": str(e)}, 500)
+        # Akademisyen Bilgisi (Önce tam, tutmazsa bulanık eşleşme)
+        acc, _, candidates = resolve_academician(name)
+        if not acc:
+            return JsonResponse({
+                "error": "Bulunamadi",
+                "candidates": [{"name": c[3].get("Fullname"), "score": round(c[0], 3)} for c in candidates]
+            }, status=404)
+
+        # Önbellek anahtarı veritabanındaki isim (Farklı yazımlar aynı kayda düşer)
+        key = normalize_name(acc.get("Fullname"))
+        generation = PROFILE_CACHE.generation(key)
+        content = PROFILE_CACHE.get(key)
+        if content is None:
+            content = JsonResponse(build_profile_payload(acc)).content
+            PROFILE_CACHE.put(key, content, generation)
+        return HttpResponse(content, content_type='application/json')
+    except Exception as e: return JsonResponse({"error": str(e)}, status=500)
 
 @csrf_exempt
 def api_project_decision(request):
@@ -550,14 +1059,27 @@ def api_project_decision(request):
     if request.method == "OPTIONS": return JsonResponse({})
     try:
         d = json.loads(request.body)
+        pid = str(d.get("projId"))
+
+        # Önbellekten silinecekler: karar veren, projede karar vermiş diğerleri
+        # ve projeyle eşleşen herkes (ortak listeleri değişiyor)
+        affected = {normalize_name(d.get("academician"))}
+        affected.update(DB['MATCHES_BY_PROJECT'].get(pid, ()))
+
         # Varsa güncelle, yoksa ekle
         found = False
         for item in DB['FEEDBACK']:
-            if item.get("academician") == d.get("academician") and str(item.get("projId")) == str(d.get("projId")):
+            if str(item.get("projId")) != pid: continue
+            affected.add(normalize_name(item.get("academician")))
+            if not found and item.get("academician") == d.get("academician"):
+                previous = dict(item)
                 item.update(d)
+                if ANALYTICS: ANALYTICS.apply_decision(previous, item)
                 found = True
-                break
-        if not found: DB['FEEDBACK'].append(d)
+        if not found:
+            DB['FEEDBACK'].append(d)
+            if ANALYTICS: ANALYTICS.apply_decision(None, d)
+        PROFILE_CACHE.invalidate(affected)
 
         # Dosyaya yaz
         save_path = find_file('decisions.json') or os.path.join(BASE_DIR, 'decisions.json')
@@ -566,7 +1088,7 @@ def api_project_decision(request):
 
         return JsonResponse({"status": "success"})
     except:
-        return JsonResponse({}, 400)
+        return JsonResponse({}, status=400)
 
 
 @csrf_exempt
@@ -575,18 +1097,17 @@ def api_top_projects(request):
     if request.method == "OPTIONS": return JsonResponse({})
     cnt = Counter()
     for m in DB['MATCHES']:
-        pid = str(m.get('Column3') or m.get('project_id') or "").strip()
+        pid = match_project_id(m)
         if pid: cnt[pid] += 1
 
     top = []
     for pid, c in cnt.most_common(50):
         pd = DB['PROJECTS'].get(pid, {})
-        title = pd.get("title") or pd.get("acronym") or pd.get("project_acronym") or f"Proje-{pid}"
 
         top.append({
             "id": pid,
             "count": c,
-            "title": title,
+            "title": get_project_title(pid),
             "budget": pd.get("overall_budget", "-"),
             "status": pd.get("status", "-"),
             "url": pd.get("url", "#")
@@ -715,7 +1236,399 @@ def api_network_graph(request):
 
 
 # ==========================================
-# 7. DOSYA SUNUCUSU (FILE SERVER) - ROBUST
+# 7. ANALİTİK (PROJE VE KARAR İSTATİSTİKLERİ)
+# ==========================================
+BUDGET_BINS = [0, 100_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000, float('inf')]
+BUDGET_LABELS = ["0-100K", "100K-500K", "500K-1M", "1M-2.5M", "2.5M-5M", "5M-10M", "10M+"]
+
+
+def decision_rating(fb):
+    """Karardaki puanı sayıya çevirir (Yoksa/bozuksa None)"""
+    try:
+        r = fb.get("rating")
+        return float(r) if r not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class Analytics:
+    """
+    İstatistikler açılışta pandas ile bir kez hesaplanır.
+    Eşleşme/proje kaynaklı kısımlar sabittir; karar kaynaklı sayaçlar her yeni kararda
+    artımlı güncellenir ve cevap JSON olarak hazır tutulur.
+    """
+    def __init__(self):
+        self.static = {}
+        self.recommended = {}   # proje ID -> öneri sayısı
+        self.decisions = {}     # proje ID -> {"accepted": n, "rejected": n, ...}
+        self.ratings = {}       # proje ID -> [toplam, adet]
+        self.content = b"{}"
+        self.lock = threading.Lock()
+
+    def build(self, db):
+        import pandas
+
+        # 1. Eşleşmeler: proje başına öneri sayısı, alan (Field) başına eşleşme sayısı
+        matches = pandas.DataFrame(
+            [(match_project_id(m), fuzzy_key(m.get('data'))) for m in db.get('MATCHES', [])],
+            columns=["pid", "name"]
+        )
+        matches = matches[matches["pid"] != ""]
+        self.recommended = matches["pid"].value_counts().to_dict()
+
+        fields = {}
+        for acc in db['ACADEMICIANS'].values():
+            field = acc.get("Field")
+            if isinstance(field, list): field = ", ".join(str(f) for f in field if f)
+            fields[fuzzy_key(acc.get("Fullname"))] = str(field).strip() if field else "Belirtilmemiş"
+        by_field = matches["name"].map(fields).fillna("Eşleşmeyen").value_counts()
+
+        # 2. Önerilen projeler: bütçe dağılımı ve durum kırılımı
+        rows = [db['PROJECTS'].get(pid, {}) for pid in self.recommended]
+        projects = pandas.DataFrame({
+            "budget": pandas.to_numeric(pandas.Series([p.get("overall_budget") for p in rows], dtype=object), errors="coerce"),
+            "status": [p.get("status") or "Bilinmiyor" for p in rows],
+        })
+        budgets = projects["budget"].dropna()
+        budget_bins = pandas.cut(budgets, bins=BUDGET_BINS, labels=BUDGET_LABELS, right=False).value_counts().reindex(BUDGET_LABELS, fill_value=0)
+
+        self.static = {
+            "matches_by_field": {k: int(v) for k, v in by_field.items()},
+            "budget_distribution": {
+                "bins": {k: int(v) for k, v in budget_bins.items()},
+                "count": int(budgets.count()),
+                "missing": int(projects["budget"].isna().sum()),
+                "min": float(budgets.min()) if len(budgets) else None,
+                "median": float(budgets.median()) if len(budgets) else None,
+                "mean": round(float(budgets.mean()), 2) if len(budgets) else None,
+                "max": float(budgets.max()) if len(budgets) else None,
+                "total": float(budgets.sum()),
+            },
+            "project_status": {k: int(v) for k, v in projects["status"].value_counts().items()},
+            "total_matches": int(len(matches)),
+            "recommended_projects": len(self.recommended),
+        }
+
+        # 3. Kararlar: proje başına karar sayıları ve puan toplamları
+        feedback = pandas.DataFrame(
+            [(str(fb.get("projId")), fb.get("decision") or "waiting", decision_rating(fb)) for fb in db.get('FEEDBACK', [])],
+            columns=["pid", "decision", "rating"]
+        )
+        self.decisions = {}
+        for (pid, decision), n in feedback.groupby(["pid", "decision"]).size().items():
+            self.decisions.setdefault(pid, Counter())[decision] = int(n)
+        rated = feedback.dropna(subset=["rating"]).groupby("pid")["rating"].agg(["sum", "count"])
+        self.ratings = {pid: [float(r["sum"]), int(r["count"])] for pid, r in rated.iterrows()}
+
+        self.render()
+        return self
+
+    def apply_decision(self, old, new):
+        """Yeni/güncellenen karar için sayaçları günceller (old: önceki kayıt ya da None)"""
+        with self.lock:
+            for fb, sign in ((old, -1), (new, 1)):
+                if not fb: continue
+                pid = str(fb.get("projId"))
+                counts = self.decisions.setdefault(pid, Counter())
+                counts[fb.get("decision") or "waiting"] += sign
+                rating = decision_rating(fb)
+                if rating is not None:
+                    total = self.ratings.setdefault(pid, [0.0, 0])
+                    total[0] += sign * rating
+                    total[1] += sign
+            self.render()
+
+    def render(self):
+        """Cevabı hazırlar: proje satırları sadece karar almış projeler için"""
+        totals = Counter()
+        projects = []
+        for pid, counts in self.decisions.items():
+            counts = {k: v for k, v in counts.items() if v > 0}
+            decided = sum(counts.values())
+            if not decided: continue
+            totals.update(counts)
+            r_sum, r_count = self.ratings.get(pid, [0.0, 0])
+            projects.append({
+                "id": pid,
+                "title": get_project_title(pid),
+                "recommended": int(self.recommended.get(pid, 0)),
+                "decisions": counts,
+                "acceptance_rate": round(counts.get("accepted", 0) / decided, 3),
+                "average_rating": round(r_sum / r_count, 2) if r_count else None,
+            })
+        projects.sort(key=lambda x: (x["decisions"].get("accepted", 0), x["recommended"]), reverse=True)
+
+        r_sum = sum(r[0] for r in self.ratings.values())
+        r_count = sum(r[1] for r in self.ratings.values())
+        decided = sum(totals.values())
+        self.content = JsonResponse({
+            **self.static,
+            "decisions": {
+                "total": decided,
+                "by_status": dict(totals),
+                "acceptance_rate": round(totals.get("accepted", 0) / decided, 3) if decided else 0.0,
+                "average_rating": round(r_sum / r_count, 2) if r_count else None,
+            },
+            "projects": projects,
+            "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }).content
+
+
+@csrf_exempt
+def api_analytics(request):
+    """Yönetici Paneli İstatistikleri (Hazır hesaplanmış)"""
+    if request.method == "OPTIONS": return JsonResponse({})
+    if ANALYTICS is None:
+        return JsonResponse({"error": "Istatistikler hesaplanamadi"}, status=503)
+    return HttpResponse(ANALYTICS.content, content_type='application/json')
+
+
+# Uygulama başlarken yükle (Önbellek ve analitik tanımlandıktan sonra)
+load_data()
+
+
+# ==========================================
+# 8. DIŞA / İÇE AKTARMA (EXCEL / CSV)
+# ==========================================
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def export_academicians():
+    headers = ["Ad Soyad", "E-Posta", "Proje Sayısı", "En İyi Puan"]
+    rows = ((a["name"], a["email"], a["project_count"], a["best_score"]) for a in iter_academician_summaries())
+    return headers, rows
+
+
+def export_decisions():
+    headers = ["Akademisyen", "Proje ID", "Proje Başlığı", "Karar", "Puan", "Not", "Tarih"]
+    rows = ((
+        fb.get("academician", ""),
+        str(fb.get("projId", "")),
+        get_project_title(fb.get("projId", ""), fb.get("projectTitle")),
+        fb.get("decision", ""),
+        fb.get("rating", ""),
+        fb.get("note", ""),
+        fb.get("timestamp", "")
+    ) for fb in DB.get('FEEDBACK', []))
+    return headers, rows
+
+
+def export_matches():
+    headers = ["Akademisyen", "Proje ID", "Proje Başlığı", "Puan"]
+
+    def rows():
+        for m in DB.get('MATCHES', []):
+            pid = match_project_id(m)
+            try:
+                score = parse_match_score(m)
+            except:
+                score = ""
+            yield (m.get('data', ""), pid, get_project_title(pid), score)
+    return headers, rows()
+
+
+def export_logs():
+    headers = ["Saat", "Kullanıcı", "Rol", "İşlem"]
+    rows = (tuple(log.values()) for log in DB['LOGS'])
+    return headers, rows
+
+
+EXPORTERS = {
+    'academicians': export_academicians,
+    'decisions': export_decisions,
+    'matches': export_matches,
+    'logs': export_logs,
+}
+
+
+class EchoBuffer:
+    """csv.writer'ın yazdığı satırı tutmadan geri döndürür (Streaming CSV için)"""
+    def write(self, value):
+        return value
+
+
+# Excel bu karakterlerle başlayan hücreleri formül olarak çalıştırır (CSV/formula injection)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def is_formula_like(value):
+    # Tek başına '-' (boş alan işareti) zararsızdır
+    return isinstance(value, str) and len(value) > 1 and value.startswith(FORMULA_PREFIXES)
+
+
+def safe_csv_value(value):
+    """Kullanıcıdan gelen '=HYPERLINK(...)' gibi değerlerin başına ' ekler"""
+    return "'" + value if is_formula_like(value) else value
+
+
+def stream_csv(headers, rows):
+    writer = csv.writer(EchoBuffer())
+    # Excel'in Türkçe karakterleri doğru açması için BOM
+    yield '\ufeff' + writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([safe_csv_value(v) for v in row])
+
+
+def build_xlsx(headers, rows, title):
+    """
+    openpyxl write-only modunda satırları tek tek geçici dosyaya yazar.
+    Satırlar hafızada birikmez, sonuç diskteki geçici dosyadan parça parça sunulur.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    def safe_cell(value):
+        # XML'de geçersiz kontrol karakterleri (\x07 vb.) tüm raporu düşürmesin
+        if isinstance(value, str): value = ILLEGAL_CHARACTERS_RE.sub("", value)
+        # Formüle benzeyen metinler düz metin (string) hücre olarak yazılır, çalıştırılmaz
+        if not is_formula_like(value): return value
+        cell = WriteOnlyCell(ws, value)
+        cell.data_type = 's'
+        return cell
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=title[:31])
+    ws.append(headers)
+    for row in rows:
+        ws.append([safe_cell(v) for v in row])
+
+    tmp = tempfile.TemporaryFile()
+    wb.save(tmp)
+    tmp.seek(0)
+    return tmp
+
+
+@csrf_exempt
+def api_export(request, kind):
+    """Yönetici Raporları: /api/export/<tür>/?format=xlsx|csv"""
+    if request.method == "OPTIONS": return JsonResponse({})
+    exporter = EXPORTERS.get(kind)
+    if not exporter:
+        return JsonResponse({"error": f"Bilinmeyen rapor: {kind}", "options": list(EXPORTERS)}, status=404)
+
+    fmt = request.GET.get('format', 'xlsx').lower()
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+    headers, rows = exporter()
+
+    if fmt == 'csv':
+        response = StreamingHttpResponse(stream_csv(headers, rows), content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{kind}_{stamp}.csv"'
+        return response
+
+    if fmt == 'xlsx':
+        try:
+            tmp = build_xlsx(headers, rows, kind)
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=500)
+        # FileResponse dosyayı EXPORT_CHUNK_SIZE'lık parçalar halinde gönderir ve sonunda kapatır
+        response = FileResponse(
+            tmp, as_attachment=True, filename=f"{kind}_{stamp}.xlsx",
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        response.block_size = EXPORT_CHUNK_SIZE
+        return response
+
+    return JsonResponse({"error": f"Desteklenmeyen format: {fmt}"}, status=400)
+
+
+# --- EŞLEŞME EXCEL'İ İÇE AKTARMA (n8n çıktısı -> JSON) ---
+# Excel sütunu -> JSON alanı (Column1 = İsim, Column3 = Proje ID, Column7 = Puan)
+MATCH_IMPORT_COLUMNS = {'data': 'A', 'project_id': 'C', 'score': 'G'}
+IMPORT_REJECT_SAMPLE = 20
+
+
+def excel_cell_value(value):
+    """Excel'in sayıya çevirdiği ID'leri düzeltir (101041867.0 -> '101041867')"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, str):
+        value = value.strip()
+    return value
+
+
+def iter_match_sheet(xlsx_path, sheet=None, columns=None):
+    """Excel'i read-only modda satır satır okur, sadece eşlenen sütunları döndürür"""
+    from openpyxl import load_workbook
+    from openpyxl.utils import column_index_from_string
+
+    columns = columns or MATCH_IMPORT_COLUMNS
+    col_idx = {field: column_index_from_string(letter) - 1 for field, letter in columns.items()}
+    max_col = max(col_idx.values()) + 1
+
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        # n8n'in yazdığı dosyalarda boyut bilgisi hatalı olabiliyor, sonuna kadar oku
+        ws.reset_dimensions()
+        for row in ws.iter_rows(max_col=max_col, values_only=True):
+            item = {}
+            for field, i in col_idx.items():
+                value = excel_cell_value(row[i]) if i < len(row) else None
+                if value is not None and value != "":
+                    item[field] = value
+            yield item
+    finally:
+        wb.close()
+
+
+def import_match_workbook(xlsx_path, out_path=None, sheet=None, columns=None):
+    """
+    n8n eşleşme Excel'ini temizleyip hızlı yüklenen JSON formatına yazar.
+    Satırlar hafızada tutulmaz: okunan her geçerli satır doğrudan dosyaya yazılır.
+    """
+    out_path = out_path or find_file(TARGET_FILES['matches']) or os.path.join(BASE_DIR, TARGET_FILES['matches'])
+    report = {"file": out_path, "imported": 0, "rejected": 0, "reasons": Counter(), "samples": []}
+
+    def on_reject(index, item, reason):
+        report["rejected"] += 1
+        report["reasons"][reason] += 1
+        if len(report["samples"]) < IMPORT_REJECT_SAMPLE:
+            # Excel satır numarası 1'den başlar
+            report["samples"].append({"row": index + 1, "reason": reason, "values": item})
+
+    def validate(item):
+        # Puanı okunamayan satır profilde ve raporlarda hataya yol açar
+        try:
+            parse_match_score(item)
+        except (TypeError, ValueError):
+            return "geçersiz puan"
+        return None
+
+    tmp_path = out_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("[\n")
+            for item in clean_match_rows(iter_match_sheet(xlsx_path, sheet, columns), on_reject, validate):
+                if 'project_id' in item: item['project_id'] = str(item['project_id'])
+                if report["imported"]: f.write(",\n")
+                json.dump(item, f, ensure_ascii=False)
+                report["imported"] += 1
+            f.write("\n]\n")
+        os.replace(tmp_path, out_path)
+    except Exception:
+        # Okuma yarıda kalırsa (bozuk dosya, olmayan sayfa) mevcut JSON'a dokunulmaz
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+        raise
+
+    report["reasons"] = dict(report["reasons"])
+    return report
+
+
+def run_import_matches(args):
+    """Komut satırı: python app.py import_matches dosya.xlsx [sayfa] [çıktı.json]"""
+    if not args:
+        print("Kullanım: python app.py import_matches dosya.xlsx [sayfa] [çıktı.json]")
+        return 1
+    sheet = args[1] if len(args) > 1 else None
+    out_path = args[2] if len(args) > 2 else None
+    report = import_match_workbook(args[0], out_path, sheet)
+    print(json.dumps(report, indent=4, ensure_ascii=False, default=str))
+    return 0
+
+
+# ==========================================
+# 9. DOSYA SUNUCUSU (FILE SERVER) - ROBUST
 # ==========================================
 def serve_file(request, folder, filename):
     """
@@ -742,6 +1655,14 @@ def serve_file(request, folder, filename):
 
     # 2. Dosyayı Bul
     target_file = filename.lower()
+    # Fotoğraf klasörü açılışta indekslendi (Sonradan eklenen dosyalar için tarama devam eder)
+    if folder.lower() == PHOTO_DIR and 'NAME_INDEX' in DB:
+        real_name = DB['NAME_INDEX'].photo_files.get(target_file)
+        if real_name:
+            full_path = os.path.join(folder_path, real_name)
+            content_type, _ = mimetypes.guess_type(full_path)
+            return FileResponse(open(full_path, 'rb'), content_type=content_type or 'image/jpeg')
+
     for f in os.listdir(folder_path):
         if f.lower() == target_file:
             full_path = os.path.join(folder_path, f)
@@ -753,7 +1674,7 @@ def serve_file(request, folder, filename):
 
 
 # ==========================================
-# 8. URL YÖNLENDİRMELERİ
+# 10. URL YÖNLENDİRMELERİ
 # ==========================================
 urlpatterns = [
     path('', index),
@@ -768,13 +1689,17 @@ urlpatterns = [
     path('api/announcements/', api_announcements),
     path('api/messages/', api_messages),
     path('api/network-graph/', api_network_graph),
+    path('api/analytics/', api_analytics),
+    path('api/export/<str:kind>/', api_export),
     # Resim yolları
     path('images/<str:filename>', lambda r, filename: serve_file(r, 'images', filename)),
-    path('akademisyen_fotograflari/<str:filename>',
-         lambda r, filename: serve_file(r, 'akademisyen_fotograflari', filename)),
+    path(f'{PHOTO_DIR}/<str:filename>',
+         lambda r, filename: serve_file(r, PHOTO_DIR, filename)),
 ]
 
 application = get_wsgi_application()
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "import_matches":
+        sys.exit(run_import_matches(sys.argv[2:]))
     execute_from_command_line(sys.argv)
@@ -0,0 +1,95 @@
+import io
+import datetime
+import json
+import tempfile
+import unittest
+
+import app
+from django.test import Client
+
+
+class ExportTests(unittest.TestCase):
+    def setUp(self):
+        # Loglar geçici klasöre yazılsın, repo'daki veri dosyalarına dokunulmasın
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_logs = app.DB['LOGS']
+        app.DB['LOGS'] = app.LogStore(self.tmp.name).open()
+        self.client = Client()
+
+    def tearDown(self):
+        app.DB['LOGS'] = self.original_logs
+        self.tmp.cleanup()
+
+    def test_xlsx_export_with_control_character_username(self):
+        self.client.post('/api/login/', json.dumps({"username": "bad\x07user", "password": "x"}),
+                         content_type='application/json')
+
+        r = self.client.get('/api/export/logs/?format=xlsx')
+        self.assertEqual(r.status_code, 200)
+
+        from openpyxl import load_workbook
+        wb = load_workbook(io.BytesIO(b''.join(r.streaming_content)))
+        users = [row[1] for row in wb.active.iter_rows(min_row=2, values_only=True)]
+        self.assertIn("baduser", users)
+
+
+# 12 ay önce: arşivlenir ama saklama süresi dolmamıştır
+OLD_MONTH = app.month_shift(datetime.datetime.now().strftime("%Y-%m"), -12)
+OLD_Y, OLD_M = OLD_MONTH.split("-")
+
+
+class LogStoreTests(unittest.TestCase):
+    LEGACY = [
+        {"timestamp": f"{OLD_MONTH}-28 00:16:58", "name": "AHMET BAYLAR", "role": "academician", "action": "Çıkış Yapıldı"},
+        {"timestamp": f"{OLD_MONTH}-29 15:49:39", "name": "Admin", "role": "Yönetici", "action": "Giriş Başarılı"},
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_logs = app.DB['LOGS']
+        # Eski kayıtlar taşınırken arşivlenir (hafızada kalmaz)
+        app.DB['LOGS'] = app.LogStore(self.tmp.name + '/logs').open(self.LEGACY)
+        self.client = Client()
+
+    def tearDown(self):
+        app.DB['LOGS'] = self.original_logs
+        self.tmp.cleanup()
+
+    def test_len_counts_archived_segments(self):
+        self.assertEqual(app.DB['LOGS'].hot_count(), 0)
+        self.assertEqual(len(app.DB['LOGS']), 2)
+        self.assertEqual(self.client.get('/api/test/').json()["DB_COUNTS"]["LOGS"], 2)
+
+    def test_admin_log_range_accepts_ingest_formats(self):
+        iso, dotted = f"{OLD_MONTH}-28", f"28.{OLD_M}.{OLD_Y}"
+        for start, end in [(iso, iso), (dotted, dotted), (dotted + " 00:00", iso + " 23:59:59")]:
+            logs = self.client.get('/api/admin-data/', {"start": start, "end": end}).json()["logs"]
+            self.assertEqual([log["Kullanıcı"] for log in logs], ["AHMET BAYLAR"], (start, end))
+
+    def test_admin_log_range_rejects_bad_date(self):
+        r = self.client.get('/api/admin-data/', {"start": "yesterday"})
+        self.assertEqual(r.status_code, 400)
+
+
+class ProfileCacheTests(unittest.TestCase):
+    def test_put_after_concurrent_invalidate_is_dropped(self):
+        cache = app.ProfileCache(4)
+        generation = cache.generation("ALI DENIZ")
+        # Cevap hazırlanırken karar yazılır
+        cache.invalidate({"ALI DENIZ"})
+        cache.put("ALI DENIZ", b"stale", generation)
+        self.assertIsNone(cache.get("ALI DENIZ"))
+
+        cache.put("ALI DENIZ", b"fresh", cache.generation("ALI DENIZ"))
+        self.assertEqual(cache.get("ALI DENIZ"), b"fresh")
+
+    def test_put_after_clear_is_dropped(self):
+        cache = app.ProfileCache(4)
+        generation = cache.generation("ALI DENIZ")
+        cache.clear()
+        cache.put("ALI DENIZ", b"stale", generation)
+        self.assertIsNone(cache.get("ALI DENIZ"))
+
+
+if __name__ == "__main__":
+    unittest.main()